@@ -18,11 +18,19 @@ RI_* Columns:
 """
 
 import re
+import csv
 import time
+import shelve
+import argparse
+import ahocorasick
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import xlsxwriter
+import lxml.html
+from lxml import etree
 
 
 # =========================
@@ -39,9 +47,32 @@ HEADERS = {
     ),
     "Accept-Language": "en-US,en;q=0.9",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",  # br is decoded by urllib3 via the brotli package
     "Connection": "keep-alive",
 }
 
+# Profile fetching: parallel workers + retry on throttling / server errors
+PROFILE_WORKERS = 16
+POOL_SIZE = 32
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+MAX_RETRIES = 3
+BACKOFF_S = 0.5
+
+# On-disk cache of parsed profile extras, reused across runs until stale
+PROFILE_CACHE_PATH = "profile_cache.db"
+PROFILE_CACHE_TTL_S = 7 * 24 * 3600
+# Bump whenever parse_profile_extras output changes; entries from another version are misses
+PROFILE_CACHE_VERSION = 1
+
+# Scrape output on disk:
+# - list rows (LIST_COLS), appended and flushed after every list page
+# - raw rows (EXPECTED_COLS), list rows joined with cached profile extras; input of clean_and_export
+LIST_CSV_PATH = "odoo_partners_list.csv"
+RAW_CSV_PATH = "odoo_partners_raw.csv"
+
+# Print profile-fetch progress every N profiles
+PROGRESS_EVERY = 100
+
 # =========================
 # List-page regex patterns
 # =========================
@@ -50,6 +81,10 @@ REFS_RE = re.compile(r"\b(\d+)\s+References?\b")
 EXPERTS_RE = re.compile(r"\b(\d+)\s+Certified Experts?\b")
 LOC_RE = re.compile(r"%\s+(.+?)\s+Average Project:", re.DOTALL)
 
+# Partner cards link to their profile under /partners/<slug>; skips nav/footer/language anchors
+PARTNER_LINK_PREFIX = "/partners/"
+LIST_CHUNK_SIZE = 8192
+
 # =========================
 # Fixed industries (22)
 # =========================
@@ -78,18 +113,68 @@ ALLOWED_INDUSTRIES = [
     "Wholesale / Retail",
 ]
 
+# =========================
+# Profile-page regex patterns
+# =========================
+WS_RE = re.compile(r"\s+")
+
+# Page content lives in <main>; the site header (mega-menu) and footer carry no profile data
+MAIN_XPATH = etree.XPath("//main")
+
+# All profile fields in one pass (dispatch on m.lastgroup).
+# Largest/Average only count after "References Sizes"; the retention value is
+# the first number after the "Customer Retention" label (RET_VALUE_RE).
+PROFILE_RE = re.compile(
+    r"\bReferences\s*-\s*(?P<total>\d+)\b"
+    r"|\b(?P<sizes>References\s+Sizes)\b"
+    r"|\b(?P<retention>Customer\s+Retention)\b"
+    r"|\bLargest:\s*~?\s*(?P<largest>\d+)\s*\+?\s*users?\b"
+    r"|\bAverage:\s*~?\s*(?P<average>\d+)\s*\+?\s*users?\b"
+    r"|\b(?P<cert_count>\d+)\s+Certified\s+v(?P<cert_version>\d+)\b",
+    re.IGNORECASE,
+)
+RET_VALUE_RE = re.compile(r"\b(\d{1,3})\s*%?\b")
+
+# Where the "References - N" industries block ends
+STOP_MARKERS = [
+    r"\bReferences\s+Sizes\b",
+    r"\bCustomer\s+Retention\b",
+    r"\bCertified\s+Experts?\b",
+    r"\bAverage\s+Project\b",
+    r"\bIndustries\b",
+    r"\bAbout\b",
+    r"\bGold\b",
+    r"\bSilver\b",
+    r"\bReady\b",
+]
+STOP_RE = re.compile("|".join(STOP_MARKERS), re.IGNORECASE)
+
+# ONLY the 22 industries: one Aho-Corasick pass finds every label,
+# then the count right before each hit is read with a tiny anchored regex
+INDUSTRY_AUTOMATON = ahocorasick.Automaton()
+for _lab in ALLOWED_INDUSTRIES:
+    INDUSTRY_AUTOMATON.add_word(_lab, _lab)
+INDUSTRY_AUTOMATON.make_automaton()
+
+COUNT_BEFORE_RE = re.compile(r"\b(\d{1,6})\s+$")
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
 
 # =========================
 # Helpers: fixed RI columns
 # =========================
+NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
 def make_safe_ri_column(label: str) -> str:
     """
     Fixed safe column names for the 22 industries.
+    Any run of non-alphanumerics (spaces, "/", "&", "_", ...) becomes a single "_".
     """
-    lab = label.strip()
-    lab = re.sub(r"\s+", " ", lab)
-    lab = re.sub(r"[^A-Za-z0-9]+", "_", lab)
-    lab = re.sub(r"_+", "_", lab).strip("_")
+    lab = NON_ALNUM_RE.sub("_", label.strip()).strip("_")
     return f"RI_{lab}"
 
 
@@ -97,24 +182,88 @@ ALLOWED_LABEL_TO_RI_COL = {lab: make_safe_ri_column(lab) for lab in ALLOWED_INDU
 ALLOWED_RI_COLS = [ALLOWED_LABEL_TO_RI_COL[lab] for lab in ALLOWED_INDUSTRIES]
 
 
+LIST_COLS = ["Partner Name", "Tier", "Location", "References", "Certified Experts", "Profile URL"]
+BASE_COLS = LIST_COLS + [
+    "Certified Versions", "References Total", "Customer Retention %",
+    "Largest Reference Users", "Average Reference Users",
+    "Reference Industries",
+]
+EXPECTED_COLS = BASE_COLS + ALLOWED_RI_COLS
+
+
 def init_ri_zero_dict() -> dict:
     return {col: 0 for col in ALLOWED_RI_COLS}
 
 
+def init_profile_extras() -> dict:
+    """
+    Empty profile extras (in EXPECTED_COLS order), used when a profile is missing or unreadable.
+    """
+    extras = {
+        "Certified Versions": "",
+        "References Total": None,
+        "Customer Retention %": None,
+        "Largest Reference Users": None,
+        "Average Reference Users": None,
+        "Reference Industries": "",
+    }
+    extras.update(init_ri_zero_dict())
+    return extras
+
+
+# =========================
+# Helpers: HTML text
+# =========================
+def node_text(node) -> str:
+    """
+    Visible text of an lxml node, one space between text fragments.
+    """
+    return " ".join(s.strip() for s in node.itertext() if s.strip())
+
+
 # =========================
 # Core parsing (list page)
 # =========================
-def parse_partner_text(text: str):
+def iter_partner_links(r: requests.Response):
+    """
+    Yield the partner-profile <a> elements of a list page while it downloads.
+    Needs a stream=True response. Once the caller moves on, the anchor is cleared and
+    everything parsed before it (earlier siblings of it and of its ancestors) is dropped,
+    so the in-memory tree stays around one card plus its open ancestors.
+    """
+    # trust only an explicit charset (requests guesses ISO-8859-1 for bare text/html);
+    # otherwise libxml2 detects it from <meta charset>
+    encoding = r.encoding if "charset" in r.headers.get("Content-Type", "") else None
+    parser = etree.HTMLPullParser(events=("end",), tag="a", encoding=encoding)
+
+    def drain():
+        for _, a in parser.read_events():
+            if (a.get("href") or "").startswith(PARTNER_LINK_PREFIX):
+                yield a
+            a.clear(keep_tail=True)
+
+            # earlier siblings at every level are closed and already handled
+            node = a
+            while node is not None:
+                parent = node.getparent()
+                while parent is not None and node.getprevious() is not None:
+                    del parent[0]
+                node = parent
+
+    for chunk in r.iter_content(LIST_CHUNK_SIZE):
+        parser.feed(chunk)
+        yield from drain()
+
+    parser.close()
+    yield from drain()
+
+
+def parse_partner_text(text: str, m_tier: re.Match):
     """
     Parse one candidate anchor's visible text into structured fields.
+    text must be whitespace-normalized; m_tier is TIER_RE's match on it (done by the caller).
     Returns dict with required columns or None if not a valid partner row.
     """
-    text = " ".join(text.split()).strip()
-
-    m_tier = TIER_RE.search(text)
-    if not m_tier:
-        return None
-
     tier = m_tier.group(1)
     name = text[:m_tier.start()].strip()
 
@@ -142,45 +291,97 @@ def parse_partner_text(text: str):
     }
 
 
+# =========================
+# HTTP
+# =========================
+def make_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """
+    Shared session: default headers, a keep-alive pool sized for the profile workers,
+    and exponential-backoff retries on 429/5xx and connection errors.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_S,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_profile_html(session: requests.Session, profile_url: str, sleep_s: float = 0.0):
+    """
+    Download one profile page. Returns the raw body, or None on failure.
+    """
+    try:
+        r = session.get(profile_url, timeout=30)
+    except requests.RequestException:
+        return None
+
+    if sleep_s:
+        time.sleep(sleep_s)
+
+    return r.content if r.status_code == 200 else None
+
+
 # =========================
 # Profile parsing (extras)
 # =========================
-def fetch_profile_extras(session: requests.Session, profile_url: str, sleep_s: float = 0.0):
+def parse_profile_extras(html):
     """
-    Extracts profile extras + fills fixed RI columns.
+    Extracts profile extras + fills fixed RI columns from a profile page body.
     Industries:
     - bounded to the "References - N" section
     - only matches your 22 industries (prevents garbage)
     """
-    extras = {
-        "Certified Versions": "",
-        "References Total": None,
-        "Customer Retention %": None,
-        "Largest Reference Users": None,
-        "Average Reference Users": None,
-        "Reference Industries": "",
-    }
-    extras.update(init_ri_zero_dict())
-
-    if not profile_url:
-        return extras
+    extras = init_profile_extras()
 
-    try:
-        r = session.get(profile_url, headers=HEADERS, timeout=30)
-        if r.status_code != 200:
-            return extras
-    except Exception:
+    if not html:
         return extras
 
-    soup = BeautifulSoup(r.text, "html.parser")
-    raw_space = soup.get_text(" ", strip=True)
-    norm = re.sub(r"\s+", " ", raw_space).strip()
-
-    if sleep_s:
-        time.sleep(sleep_s)
+    tree = lxml.html.fromstring(html)
+    mains = MAIN_XPATH(tree)
+    content = mains[0] if mains else tree
+    etree.strip_elements(content, "script", "style", with_tail=False)
+    raw_space = node_text(content)
+    norm = WS_RE.sub(" ", raw_space).strip()
+
+    # ---- Single pass: certified versions, totals, retention, sizes ----
+    cert_pairs = []
+    total_end = None
+    ret_end = None
+    sizes_seen = False
+    for m in PROFILE_RE.finditer(norm):
+        kind = m.lastgroup
+        if kind == "cert_version":
+            cert_pairs.append((m.group("cert_count"), m.group("cert_version")))
+        elif kind == "total":
+            if total_end is None:
+                extras["References Total"] = int(m.group("total"))
+                total_end = m.end()
+        elif kind == "retention":
+            if ret_end is None:
+                ret_end = m.end()
+        elif kind == "sizes":
+            sizes_seen = True
+        elif kind == "largest":
+            if sizes_seen and extras["Largest Reference Users"] is None:
+                extras["Largest Reference Users"] = int(m.group("largest"))
+        elif kind == "average":
+            if sizes_seen and extras["Average Reference Users"] is None:
+                extras["Average Reference Users"] = int(m.group("average"))
+
+    if ret_end is not None:
+        m_ret = RET_VALUE_RE.search(norm, ret_end)
+        if m_ret:
+            extras["Customer Retention %"] = int(m_ret.group(1))
 
     # ---- Certified versions ----
-    cert_pairs = re.findall(r"\b(\d+)\s+Certified\s+v(\d+)\b", norm, flags=re.IGNORECASE)
     if cert_pairs:
         agg = {}
         for cnt, ver in cert_pairs:
@@ -190,57 +391,34 @@ def fetch_profile_extras(session: requests.Session, profile_url: str, sleep_s: f
             f"{k}:{agg[k]}" for k in sorted(agg.keys(), key=lambda x: int(x[1:]), reverse=True)
         )
 
-    # ---- References Total ----
-    m_total = re.search(r"\bReferences\s*-\s*(\d+)\b", norm, flags=re.IGNORECASE)
-    if m_total:
-        extras["References Total"] = int(m_total.group(1))
-
-    # ---- Customer Retention ----
-    m_ret = re.search(r"\bCustomer\s+Retention\b.*?\b(\d{1,3})\s*%?\b", norm, flags=re.IGNORECASE)
-    if m_ret:
-        extras["Customer Retention %"] = int(m_ret.group(1))
-
-    # ---- References Sizes: Largest / Average ----
-    m_largest = re.search(
-        r"\bReferences\s+Sizes\b.*?\bLargest:\s*~?\s*(\d+)\s*\+?\s*users?\b",
-        norm, flags=re.IGNORECASE
-    )
-    if m_largest:
-        extras["Largest Reference Users"] = int(m_largest.group(1))
-
-    m_avg = re.search(
-        r"\bReferences\s+Sizes\b.*?\bAverage:\s*~?\s*(\d+)\s*\+?\s*users?\b",
-        norm, flags=re.IGNORECASE
-    )
-    if m_avg:
-        extras["Average Reference Users"] = int(m_avg.group(1))
-
     # ---- Industries block (bounded) ----
-    if not m_total:
+    if total_end is None:
         return extras
 
-    tail = norm[m_total.end():].strip()
-
-    stop_markers = [
-        r"\bReferences\s+Sizes\b",
-        r"\bCustomer\s+Retention\b",
-        r"\bCertified\s+Experts?\b",
-        r"\bAverage\s+Project\b",
-        r"\bIndustries\b",
-        r"\bAbout\b",
-        r"\bGold\b",
-        r"\bSilver\b",
-        r"\bReady\b",
-    ]
-    stop_re = re.compile("|".join(stop_markers), flags=re.IGNORECASE)
-    m_stop = stop_re.search(tail)
+    tail = norm[total_end:].strip()
+
+    m_stop = STOP_RE.search(tail)
     block = tail[:m_stop.start()].strip() if m_stop else tail
 
     # Match ONLY the 22 industries preceded by a number, anywhere in the block
-    label_alt = "|".join(re.escape(x) for x in sorted(ALLOWED_INDUSTRIES, key=len, reverse=True))
-    patt = re.compile(rf"\b(\d{{1,6}})\s+({label_alt})\b")
+    # Same hits as rf"\b(\d{{1,6}})\s+({labels})\b" with findall:
+    # - trailing \b: a word boundary right after the label
+    #   (so a label ending in ")" only counts when a word character follows it)
+    # - no overlaps: a count cannot start inside the previous accepted hit
+    #   (e.g. the "52" ending "ECO liable to deduct TCS u/s 52")
+    found = []
+    prev_end = 0
+    for end_idx, lab in INDUSTRY_AUTOMATON.iter(block):
+        nxt = block[end_idx + 1:end_idx + 2]
+        if _is_word_char(lab[-1]) == _is_word_char(nxt):
+            continue
+
+        start = end_idx - len(lab) + 1
+        m_count = COUNT_BEFORE_RE.search(block, max(prev_end, start - 8), start)
+        if m_count:
+            found.append((m_count.group(1), lab))
+            prev_end = end_idx + 1
 
-    found = patt.findall(block)
     if found:
         dedup = {}
         order = []
@@ -267,93 +445,192 @@ def fetch_profile_extras(session: requests.Session, profile_url: str, sleep_s: f
 # =========================
 # Scraper
 # =========================
-def scrape_partners(page_start=1, page_end=188, sleep_s=1.0, profile_sleep_s=0.0):
+def scrape_list_pages(session: requests.Session, page_start: int, page_end: int, sleep_s: float = 1.0,
+                      list_csv_path=LIST_CSV_PATH):
     """
-    Scrape partners from page_start..page_end inclusive.
-    Adds profile extras for each partner URL (cached).
+    Phase 1: write partner rows (LIST_COLS, no extras) from page_start..page_end inclusive
+    to list_csv_path, flushing after every page. Returns list_csv_path.
     """
-    session = requests.Session()
-    all_rows = []
-    profile_cache = {}
+    with open(list_csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=LIST_COLS)
+        writer.writeheader()
 
-    for page_num in range(page_start, page_end + 1):
-        url = PAGE_URL.format(page_num)
-        print(f"Fetching page {page_num}: {url}")
+        for page_num in range(page_start, page_end + 1):
+            url = PAGE_URL.format(page_num)
+            print(f"Fetching page {page_num}: {url}")
 
-        r = session.get(url, headers=HEADERS, timeout=30)
-        if r.status_code != 200:
-            print(f"  -> HTTP {r.status_code}. Skipping.")
-            continue
+            with session.get(url, timeout=30, stream=True) as r:
+                if r.status_code != 200:
+                    print(f"  -> HTTP {r.status_code}. Skipping.")
+                    continue
 
-        soup = BeautifulSoup(r.text, "html.parser")
+                # anchors are parsed as the page streams in
+                for a in iter_partner_links(r):
+                    t = " ".join(node_text(a).split())
+                    # cheap substring pre-check; TIER_RE still enforces word boundaries
+                    if "Gold" not in t and "Silver" not in t and "Ready" not in t:
+                        continue
 
-        for a in soup.find_all("a"):
-            t = a.get_text(" ", strip=True)
-            if not t or not TIER_RE.search(t):
-                continue
+                    m_tier = TIER_RE.search(t)
+                    if not m_tier:
+                        continue
 
-            parsed = parse_partner_text(t)
-            if not parsed:
-                continue
+                    parsed = parse_partner_text(t, m_tier)
+                    if not parsed:
+                        continue
 
-            href = a.get("href") or ""
-            profile_url = urljoin(BASE, href) if href.startswith("/") else ""
-            parsed["Profile URL"] = profile_url
+                    # hrefs are site-relative (/partners/...), so plain concatenation is enough
+                    parsed["Profile URL"] = BASE + a.get("href")
 
-            if profile_url:
-                if profile_url not in profile_cache:
-                    profile_cache[profile_url] = fetch_profile_extras(
-                        session, profile_url, sleep_s=profile_sleep_s
-                    )
-                parsed.update(profile_cache[profile_url])
-            else:
-                # ensure RI columns exist even without profile
-                parsed.update(init_ri_zero_dict())
+                    writer.writerow(parsed)
 
-            all_rows.append(parsed)
+            # rows of finished pages survive a crash later in the run
+            f.flush()
+            time.sleep(sleep_s)
 
-        time.sleep(sleep_s)
+    return list_csv_path
+
+
+def update_profile_cache(session: requests.Session, profile_urls, sleep_s: float = 0.0,
+                         workers=PROFILE_WORKERS, cache_path=PROFILE_CACHE_PATH, refresh=False):
+    """
+    Phase 2: make sure every unique profile URL has a current entry in the cache.
+    Missing/stale entries are fetched by `workers` threads and parsed in order as they arrive;
+    URLs whose fetch fails are left without an entry.
+    """
+    with shelve.open(cache_path) as shelf:
+        now = time.time()
+        to_fetch = []
+        for profile_url in profile_urls:
+            hit = None if refresh else shelf.get(profile_url)
+            if not (hit and hit.get("version") == PROFILE_CACHE_VERSION
+                    and now - hit["fetched_at"] < PROFILE_CACHE_TTL_S):
+                to_fetch.append(profile_url)
+
+        print(
+            f"Fetching {len(to_fetch)} partner profiles "
+            f"({len(profile_urls) - len(to_fetch)} cached, {workers} workers)"
+        )
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            bodies = pool.map(lambda u: fetch_profile_html(session, u, sleep_s=sleep_s), to_fetch)
+            for done, (profile_url, html) in enumerate(zip(to_fetch, bodies), start=1):
+                if html:
+                    shelf[profile_url] = {
+                        "version": PROFILE_CACHE_VERSION,
+                        "fetched_at": time.time(),
+                        "extras": parse_profile_extras(html),
+                    }
+                else:
+                    # no entry => empty extras in the join, and the next run retries it
+                    shelf.pop(profile_url, None)
+                    failed += 1
+
+                if done % PROGRESS_EVERY == 0 or done == len(to_fetch):
+                    shelf.sync()
+                    print(f"  -> profiles {done}/{len(to_fetch)} ({failed} failed)")
+
+
+def join_profile_extras(list_csv_path=LIST_CSV_PATH, raw_csv_path=RAW_CSV_PATH,
+                        cache_path=PROFILE_CACHE_PATH):
+    """
+    Phase 3: stream list rows, add their cached profile extras, write EXPECTED_COLS rows
+    to raw_csv_path. Returns raw_csv_path.
+    """
+    with shelve.open(cache_path, flag="r") as shelf, \
+            open(list_csv_path, newline="", encoding="utf-8") as src, \
+            open(raw_csv_path, "w", newline="", encoding="utf-8") as dst:
+        writer = csv.DictWriter(dst, fieldnames=EXPECTED_COLS)
+        writer.writeheader()
+        for row in csv.DictReader(src):
+            # RI columns are written even without a profile
+            hit = shelf.get(row["Profile URL"]) if row["Profile URL"] else None
+            extras = hit["extras"] if hit else init_profile_extras()
+            writer.writerow({**row, **extras})
+
+    return raw_csv_path
+
+
+def scrape_partners(page_start=1, page_end=188, sleep_s=1.0, profile_sleep_s=0.0,
+                    cache_path=PROFILE_CACHE_PATH, refresh=False, list_csv_path=LIST_CSV_PATH,
+                    raw_csv_path=RAW_CSV_PATH, profile_workers=PROFILE_WORKERS):
+    """
+    Scrape partners from page_start..page_end inclusive.
+    List rows go to list_csv_path page by page; each unique profile is fetched once
+    (by profile_workers threads) into the on-disk cache at cache_path (refresh=True ignores it);
+    the rows joined with their extras are then written to raw_csv_path. Returns raw_csv_path.
+    """
+    # one shared session; its pool must hold a connection per worker thread
+    session = make_session(pool_size=max(POOL_SIZE, profile_workers))
+
+    # 1) list pages -> list CSV
+    scrape_list_pages(session, page_start, page_end, sleep_s=sleep_s, list_csv_path=list_csv_path)
+
+    # 2) unique profile URLs (first-seen order) -> profile cache
+    with open(list_csv_path, newline="", encoding="utf-8") as f:
+        profile_urls = list(dict.fromkeys(
+            row["Profile URL"] for row in csv.DictReader(f) if row["Profile URL"]
+        ))
+    update_profile_cache(
+        session, profile_urls, sleep_s=profile_sleep_s, workers=profile_workers,
+        cache_path=cache_path, refresh=refresh,
+    )
 
-    return pd.DataFrame(all_rows)
+    # 3) list CSV + cache -> raw CSV
+    return join_profile_extras(list_csv_path, raw_csv_path, cache_path=cache_path)
 
 
 # =========================
 # Clean + Export
 # =========================
-def clean_and_export(df: pd.DataFrame,
+def write_xlsx(df: pd.DataFrame, xlsx_path: str):
+    """
+    Stream df to an .xlsx file row by row (xlsxwriter constant_memory mode).
+    Missing values become empty cells.
+    """
+    # constant_memory only keeps the current row, so cells must be written row-major
+    # (pandas' to_excel writes column by column and would lose data in this mode)
+    values = df.astype(object).where(df.notna(), None)
+
+    # strings_to_urls=False keeps Profile URL as plain text (as to_excel wrote it), not hyperlinks
+    with xlsxwriter.Workbook(xlsx_path, {"constant_memory": True, "strings_to_urls": False}) as wb:
+        ws = wb.add_worksheet()
+        ws.write_row(0, 0, list(df.columns))
+        for i, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            ws.write_row(i, 0, row)
+
+
+def clean_and_export(raw_csv_path=RAW_CSV_PATH,
                      csv_path="odoo_partners_full_list_clean.csv",
                      xlsx_path="odoo_partners_full_list_clean.xlsx"):
     """
-    Ensure correct types, correct columns, remove duplicates, export.
+    Load the raw CSV written by scrape_partners, ensure correct types, remove duplicates, export.
     """
-    base_cols = [
-        "Partner Name", "Tier", "Location", "References", "Certified Experts", "Profile URL",
-        "Certified Versions", "References Total", "Customer Retention %",
-        "Largest Reference Users", "Average Reference Users",
-        "Reference Industries",
-    ]
-    expected_cols = base_cols + ALLOWED_RI_COLS
-
-    df = df.reindex(columns=expected_cols)
+    # only empty cells are missing ("N/A" is a real Location value)
+    df = pd.read_csv(
+        raw_csv_path,
+        dtype={col: "Int32" for col in ALLOWED_RI_COLS},
+        keep_default_na=False,
+        na_values=[""],
+    )
 
     df["Partner Name"] = df["Partner Name"].fillna("").astype(str).str.strip()
     df = df[df["Partner Name"].ne("")]
     df = df[~df["Partner Name"].str.fullmatch(r"Find Best Match", case=False, na=False)]
 
-    for col in ["References", "Certified Experts"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
-
-    for col in ["References Total", "Customer Retention %", "Largest Reference Users", "Average Reference Users"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    count_cols = ["References", "Certified Experts"] + ALLOWED_RI_COLS
+    df[count_cols] = df[count_cols].apply(pd.to_numeric, errors="coerce").fillna(0).astype("int32")
 
-    for col in ALLOWED_RI_COLS:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+    # optional profile numbers stay missing (nullable Int32) instead of turning into floats
+    nullable_cols = ["References Total", "Customer Retention %", "Largest Reference Users", "Average Reference Users"]
+    df[nullable_cols] = df[nullable_cols].apply(pd.to_numeric, errors="coerce").astype("Int32")
 
     df = df[(df["References"] > 0) | (df["Certified Experts"] > 0)]
     df = df.drop_duplicates(subset=["Partner Name", "Tier", "Location"]).reset_index(drop=True)
 
     df.to_csv(csv_path, index=False)
-    df.to_excel(xlsx_path, index=False)
+    write_xlsx(df, xlsx_path)
 
     print(f"\n✅ Exported CSV : {csv_path}")
     print(f"✅ Exported XLSX: {xlsx_path}")
@@ -367,14 +644,20 @@ def clean_and_export(df: pd.DataFrame,
 # Run
 # =========================
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Odoo implementation partners.")
+    parser.add_argument("--refresh", action="store_true",
+                        help="ignore the on-disk profile cache and re-fetch every profile")
+    args = parser.parse_args()
+
     # Quick test:
-    df_raw = scrape_partners(page_start=1, page_end=188, sleep_s=1.0, profile_sleep_s=0.0)
+    raw_csv = scrape_partners(page_start=1, page_end=188, sleep_s=1.0, profile_sleep_s=0.0,
+                              refresh=args.refresh)
 
     # Full run later:
-    # df_raw = scrape_partners(page_start=1, page_end=186, sleep_s=1.0, profile_sleep_s=0.0)
+    # raw_csv = scrape_partners(page_start=1, page_end=186, sleep_s=1.0, profile_sleep_s=0.0)
 
     df_final = clean_and_export(
-        df_raw,
+        raw_csv,
         csv_path="odoo_partners_full_list_clean.csv",
         xlsx_path="odoo_partners_full_list_clean.xlsx"
     )